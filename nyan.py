@@ -1,8 +1,126 @@
+import bisect
 import curses
+import functools
 import sys
 import os
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# Attribute for the status and help bars; main() adds the color pair
+STATUS_ATTR = curses.A_REVERSE
+
+
+def char_width(ch, col):
+    """Return the number of screen cells ch takes when drawn at column col."""
+    if ch == '\t':
+        return 8 - col % 8  # Tabs run to the next tab stop
+    if unicodedata.combining(ch):
+        return 0
+    if unicodedata.category(ch) == 'Cc' or unicodedata.east_asian_width(ch) in 'WF':
+        return 2  # Wide characters, and control characters drawn as ^X
+    return 1
+
+
+def text_width(text):
+    """Return the number of screen cells text takes when drawn from column 0."""
+    cells = 0
+    for ch in text:
+        cells += char_width(ch, cells)
+    return cells
+
+
+@functools.lru_cache(maxsize=4096)
+def encode_row(line, width, encoding):
+    """Return line trimmed and padded to width screen cells, encoded for the terminal."""
+    # Cached on the line's contents, so unchanged rows are encoded only once
+    if line.isascii() and line.isprintable():
+        return line[:width].ljust(width).encode(encoding, 'replace')
+    cells = 0
+    for i, ch in enumerate(line):
+        step = char_width(ch, cells)
+        if cells + step > width:
+            line = line[:i]
+            break
+        cells += step
+    return (line + ' ' * (width - cells)).encode(encoding, 'replace')
+
+
+class GapLine:
+    """A single line held as a gap buffer around the edit position."""
+
+    def __init__(self, text="", gap=0):
+        # The text after the gap is kept reversed, so edits at the gap only
+        # touch sequence tails. ASCII lines use bytearrays, so typing is an
+        # in-place append; a line switches to lists of characters once
+        # non-ASCII text enters it
+        if text.isascii():
+            data = text.encode('ascii')
+            self.left = bytearray(data[:gap])
+            self.right = bytearray(data[gap:][::-1])
+        else:
+            self.left = list(text[:gap])
+            self.right = list(text[gap:][::-1])
+
+    def __len__(self):
+        return len(self.left) + len(self.right)
+
+    def __str__(self):
+        if isinstance(self.left, bytearray):
+            return (self.left + self.right[::-1]).decode('ascii')
+        return "".join(self.left) + "".join(self.right[::-1])
+
+    def _widen(self):
+        # Switch from bytearrays to lists of characters
+        if isinstance(self.left, bytearray):
+            self.left = list(self.left.decode('ascii'))
+            self.right = list(self.right.decode('ascii'))
+
+    def move_gap(self, x):
+        # Shift the characters between the old and new gap position across
+        n = len(self.left)
+        if x < n:
+            self.right.extend(self.left[x:][::-1])
+            del self.left[x:]
+        elif x > n:
+            k = x - n
+            self.left.extend(self.right[-k:][::-1])
+            del self.right[-k:]
+
+    def insert(self, ch):
+        """Insert the character with code point ch before the gap."""
+        if isinstance(self.left, bytearray):
+            if ch < 128:
+                self.left.append(ch)
+                return
+            self._widen()
+        self.left.append(chr(ch))
+
+    def backspace(self):
+        self.left.pop()
+
+    def take_left(self):
+        """Remove and return the text before the gap."""
+        if isinstance(self.left, bytearray):
+            head = self.left.decode('ascii')
+        else:
+            head = "".join(self.left)
+        self.left = self.left[:0]
+        return head
+
+    def set_left(self, text):
+        """Replace the text before the gap (which must be empty) with text."""
+        if isinstance(self.left, bytearray) and text.isascii():
+            self.left = bytearray(text, 'ascii')
+        else:
+            self._widen()
+            self.left = list(text)
+
 
 class TextEditor:
+    LOAD_CHUNK = 64 * 1024  # Characters read per chunk when loading a file
+
     def __init__(self, stdscr, filename=None):
         self.stdscr = stdscr
         self.filename = filename
@@ -11,92 +129,281 @@ class TextEditor:
         self.cursor_y = 0
         self.scroll_y = 0  # Scroll position
         self.status_message = ""
-        self.status_timer = 0
+        self.status_deadline = 0.0  # time.monotonic() at which the message expires
+        self._status_drawn = None  # Text currently on the message line
+        self._status_prefix_key = None  # State the cached status prefix was built from
+        self._status_prefix_cols = 0  # Screen width of the cached status prefix
         self.modified = False
+        self.edit_count = 0  # Bumped by every change to the text
+        self._save_pool = ThreadPoolExecutor(max_workers=1)
+        self._save_future = None  # Pending background save, if any
+        self._save_edit_count = 0  # edit_count when the pending save started
         self.cat_editor = None  # Will be set by CatEditor
+        self.dirty_lines = set()  # File rows that need repainting
+        self._painted_bottom = 0  # File row just past the painted pad band
+        self._full_redraw = True  # Repaint every pad row on next draw
+        self.pad = None  # Rendered rows around the viewport, see draw()
+        self._pad_top = 0  # File row shown on pad row 0
+        self._pad_view = None  # Screen rectangle of the last pad refresh
+        self.active = None  # GapLine for the row being edited
+        self.active_y = None  # Row of self.active; self.text[active_y] is stale
+        self._line_starts = [0]  # Absolute offset of each row; only a valid prefix is kept
+        self._text_lock = threading.Lock()  # Guards self.text against the loader thread
+        self.loading = False  # True while the rest of the file streams in
+        self._load_failed = False  # A read error left only part of the file loaded
         self.load_file()
 
     def load_file(self):
         if self.filename:
             try:
-                with open(self.filename, 'r') as file:
-                    self.text = file.readlines()
-                # Strip newlines for display
-                self.text = [line.rstrip('\n') for line in self.text]
-                self.set_status_message(f"Read file: {self.filename}")
+                file = open(self.filename, 'r', encoding='utf-8', errors='replace')
             except FileNotFoundError:
                 self.text = [""]
                 self.set_status_message(f"New file: {self.filename}")
+                return
+            # Read the first chunk now so the first screen can be drawn, and
+            # stream the rest in on a background thread
+            lines, eof = self._read_lines(file)
+            self.text = lines or [""]
+            if eof:
+                file.close()
+                self.set_status_message(f"Read file: {self.filename}")
+            else:
+                self.loading = True
+                self.set_status_message(f"Loading: {self.filename}...", ttl=100)
+                threading.Thread(target=self._load_rest, args=(file,), daemon=True).start()
         else:
             # Start with one empty line if no file is loaded
             self.text = [""]
             self.set_status_message("New buffer")
     
+    def _read_lines(self, file):
+        """Read the next chunk of whole lines; return (lines, reached_eof)."""
+        # With a size hint readlines() stops at a line boundary, so no line
+        # is split between chunks
+        data = "".join(file.readlines(self.LOAD_CHUNK))
+        lines = data.split('\n')
+        if lines[-1] == "":
+            lines.pop()
+        return lines, len(data) < self.LOAD_CHUNK
+
+    def _load_rest(self, file):
+        # Runs on the loader thread; appends the rest of the file in chunks
+        try:
+            with file:
+                eof = False
+                while not eof:
+                    lines, eof = self._read_lines(file)
+                    with self._text_lock:
+                        start = len(self.text)
+                        self.text.extend(lines)
+                        # Rows landing inside the painted band need drawing
+                        if start < self._painted_bottom:
+                            self._full_redraw = True
+            self.set_status_message(f"Read file: {self.filename}")
+        except Exception as e:
+            self._load_failed = True
+            self.set_status_message(f"Error reading: {str(e)}")
+        finally:
+            self.loading = False
+
     def save_file(self):
+        """Start writing the buffer to disk on the save thread; False if it can't start."""
+        # The result is picked up later by poll_save() or wait_for_save()
         if not self.filename:
             return False
+        if self._save_future is not None:
+            self.set_status_message("Save already in progress")
+            return False
+        if self.loading:
+            # Writing now would truncate the file to the part read so far
+            self.set_status_message("Still loading, try again")
+            return False
+        if self._load_failed:
+            # Likewise, the rest of the file never made it into the buffer
+            self.set_status_message("File was only partly read, not saving")
+            return False
         
+        self.flush_active()
+        # A shallow copy is enough: lines are immutable strings
+        snapshot = list(self.text)
+        self._save_edit_count = self.edit_count
+        self._save_future = self._save_pool.submit(self._write_snapshot, snapshot, self.filename)
+        self.set_status_message("Saving...", ttl=100)
+        return True
+
+    @staticmethod
+    def _write_snapshot(lines, filename):
+        with open(filename, 'w', encoding='utf-8', newline='\n') as file:
+            file.write('\n'.join(lines))
+            file.write('\n')
+
+    def save_pending(self):
+        return self._save_future is not None
+
+    def poll_save(self):
+        """Finish a background save if it has completed; True if one finished."""
+        if self._save_future is None or not self._save_future.done():
+            return False
+        self._finish_save()
+        return True
+
+    def wait_for_save(self):
+        """Block until the pending save completes; return whether it succeeded."""
+        if self._save_future is None:
+            return False
+        wait([self._save_future])
+        return self._finish_save()
+
+    def _finish_save(self):
+        future = self._save_future
+        self._save_future = None
         try:
-            with open(self.filename, 'w') as file:
-                for line in self.text:
-                    file.write(line + '\n')
-            self.modified = False
-            self.set_status_message(f"Saved: {self.filename}")
-            return True
+            future.result()
         except Exception as e:
             self.set_status_message(f"Error saving: {str(e)}")
             return False
+        # Edits made while the save was running are still unsaved
+        if self.edit_count == self._save_edit_count:
+            self.modified = False
+        self.set_status_message(f"Saved: {self.filename}")
+        return True
     
-    def set_status_message(self, msg, ttl=5):
+    def set_status_message(self, msg, ttl=5.0):
+        # ttl is in seconds
         self.status_message = msg
-        self.status_timer = ttl
+        self.status_deadline = time.monotonic() + ttl
+
+    def visible_status(self):
+        """Return the message line's current text ("" once the message expired)."""
+        if time.monotonic() < self.status_deadline:
+            return self.status_message
+        return ""
+
+    def status_changed(self):
+        """True if the message line on screen no longer matches visible_status()."""
+        return self.visible_status() != self._status_drawn
     
+    def line(self, y):
+        """Return row y as a string, reading through the active gap line."""
+        if y == self.active_y:
+            return str(self.active)
+        return self.text[y]
+
+    def line_len(self, y):
+        if y == self.active_y:
+            return len(self.active)
+        return len(self.text[y])
+
+    def line_start(self, y):
+        """Return the absolute offset of row y's first character."""
+        # Newlines count as one character. Starts are filled in lazily and
+        # edits truncate the list after the row they touch
+        starts = self._line_starts
+        while len(starts) <= y:
+            n = len(starts)
+            starts.append(starts[-1] + self.line_len(n - 1) + 1)
+        return starts[y]
+
+    def offset_of(self, y, x):
+        return self.line_start(y) + x
+
+    def position_of(self, offset):
+        """Return the (y, x) position of an absolute offset."""
+        self.line_start(len(self.text) - 1)
+        y = bisect.bisect_right(self._line_starts, offset) - 1
+        return y, min(offset - self._line_starts[y], self.line_len(y))
+
+    def _invalidate_starts(self, y):
+        # Rows up to and including y keep their start offsets
+        if len(self._line_starts) > y + 1:
+            del self._line_starts[y + 1:]
+
+    def flush_active(self):
+        """Write the active gap line back into self.text."""
+        if self.active_y is not None:
+            self.text[self.active_y] = str(self.active)
+            self.active = None
+            self.active_y = None
+
+    def edit_line(self):
+        """Return the gap line for the cursor row with its gap at the cursor."""
+        if self.active_y != self.cursor_y:
+            self.flush_active()
+            self.active = GapLine(self.text[self.cursor_y], self.cursor_x)
+            self.active_y = self.cursor_y
+        else:
+            self.active.move_gap(self.cursor_x)
+        return self.active
+
     def insert_char(self, ch):
         # Insert a character at cursor position
-        if not self.text:
-            self.text = [""]
+        with self._text_lock:
+            if not self.text:
+                self.text = [""]
         
-        current_line = self.text[self.cursor_y]
-        self.text[self.cursor_y] = current_line[:self.cursor_x] + chr(ch) + current_line[self.cursor_x:]
-        self.cursor_x += 1
-        self.modified = True
+            self.edit_line().insert(ch)
+            self.dirty_lines.add(self.cursor_y)
+            self._invalidate_starts(self.cursor_y)
+            self.cursor_x += 1
+            self.modified = True
+            self.edit_count += 1
     
     def insert_newline(self):
         # Handle Enter key - split line at cursor
-        if not self.text:
-            self.text = [""]
+        with self._text_lock:
+            if not self.text:
+                self.text = [""]
             
-        current_line = self.text[self.cursor_y]
-        self.text[self.cursor_y] = current_line[:self.cursor_x]
-        self.text.insert(self.cursor_y + 1, current_line[self.cursor_x:])
-        self.cursor_y += 1
-        self.cursor_x = 0
-        self.modified = True
+            # The text after the gap becomes the new active line; only the head
+            # is materialized, no other line is touched
+            current_line = self.edit_line()
+            self.text[self.cursor_y] = current_line.take_left()
+            self.text.insert(self.cursor_y + 1, "")
+            self.active_y = self.cursor_y + 1
+            # Every row from here down shifts by one; rows past the pad band
+            # are painted when the band moves over them
+            self.dirty_lines.update(range(self.cursor_y, min(len(self.text), self._painted_bottom)))
+            self._invalidate_starts(self.cursor_y)
+            self.cursor_y += 1
+            self.cursor_x = 0
+            self.modified = True
+            self.edit_count += 1
     
     def delete_char(self):
         # Delete character at cursor position
-        if not self.text:
-            return
+        with self._text_lock:
+            if not self.text:
+                return
             
-        current_line = self.text[self.cursor_y]
-        if self.cursor_x > 0:
-            # Delete character before cursor
-            self.text[self.cursor_y] = current_line[:self.cursor_x-1] + current_line[self.cursor_x:]
-            self.cursor_x -= 1
-            self.modified = True
-        elif self.cursor_y > 0:
-            # At beginning of line, join with previous line
-            prev_line = self.text[self.cursor_y - 1]
-            self.cursor_x = len(prev_line)
-            self.text[self.cursor_y - 1] = prev_line + current_line
-            self.text.pop(self.cursor_y)
-            self.cursor_y -= 1
-            self.modified = True
+            if self.cursor_x > 0:
+                # Delete character before cursor
+                self.edit_line().backspace()
+                self.dirty_lines.add(self.cursor_y)
+                self._invalidate_starts(self.cursor_y)
+                self.cursor_x -= 1
+                self.modified = True
+                self.edit_count += 1
+            elif self.cursor_y > 0:
+                # At beginning of line, join with previous line by moving it
+                # in front of the gap
+                current_line = self.edit_line()
+                prev_line = self.text[self.cursor_y - 1]
+                self.cursor_x = len(prev_line)
+                current_line.set_left(prev_line)
+                self.text.pop(self.cursor_y)
+                self.active_y = self.cursor_y - 1
+                # Rows below shift up; include the old last row so it gets blanked
+                self.dirty_lines.update(range(self.cursor_y - 1, min(len(self.text) + 1, self._painted_bottom)))
+                self._invalidate_starts(self.cursor_y - 1)
+                self.cursor_y -= 1
+                self.modified = True
+                self.edit_count += 1
     
     def move_cursor(self, key):
         if key == curses.KEY_RIGHT:
             # Move right
-            if self.cursor_x < len(self.text[self.cursor_y]):
+            if self.cursor_x < self.line_len(self.cursor_y):
                 self.cursor_x += 1
             elif self.cursor_y < len(self.text) - 1:
                 # Move to beginning of next line
@@ -110,21 +417,21 @@ class TextEditor:
             elif self.cursor_y > 0:
                 # Move to end of previous line
                 self.cursor_y -= 1
-                self.cursor_x = len(self.text[self.cursor_y])
+                self.cursor_x = self.line_len(self.cursor_y)
                 
         elif key == curses.KEY_UP:
             # Move up
             if self.cursor_y > 0:
                 self.cursor_y -= 1
                 # Adjust x position if line is shorter
-                self.cursor_x = min(self.cursor_x, len(self.text[self.cursor_y]))
+                self.cursor_x = min(self.cursor_x, self.line_len(self.cursor_y))
                 
         elif key == curses.KEY_DOWN:
             # Move down
             if self.cursor_y < len(self.text) - 1:
                 self.cursor_y += 1
                 # Adjust x position if line is shorter
-                self.cursor_x = min(self.cursor_x, len(self.text[self.cursor_y]))
+                self.cursor_x = min(self.cursor_x, self.line_len(self.cursor_y))
                 
         elif key == curses.KEY_HOME:
             # Move to beginning of line
@@ -132,9 +439,11 @@ class TextEditor:
             
         elif key == curses.KEY_END:
             # Move to end of line
-            self.cursor_x = len(self.text[self.cursor_y])
+            self.cursor_x = self.line_len(self.cursor_y)
     
     def process_keypress(self, key):
+        old_cursor_y = self.cursor_y
+        old_line_count = len(self.text)
         if key == curses.KEY_RIGHT or key == curses.KEY_LEFT or \
            key == curses.KEY_UP or key == curses.KEY_DOWN or \
            key == curses.KEY_HOME or key == curses.KEY_END:
@@ -153,7 +462,7 @@ class TextEditor:
                 confirm = self.stdscr.getch()
 
                 if confirm in (ord('y'), ord('Y')):
-                    if not self.save_file():
+                    if not (self.save_file() and self.wait_for_save()):
                         return True  # Don't exit if save failed
                 elif confirm not in (ord('n'), ord('N')):
                     self.set_status_message("Cancelled exit")
@@ -164,20 +473,22 @@ class TextEditor:
         elif 32 <= key <= 126:  # Printable ASCII
             self.insert_char(key)
             
-        # Ensure cursor is always within bounds
-        if self.cursor_y >= len(self.text):
-            self.cursor_y = len(self.text) - 1
-        if self.cursor_x > len(self.text[self.cursor_y]):
-            self.cursor_x = len(self.text[self.cursor_y])
-            
-        # Update scroll position to keep cursor visible
-        self.scroll_if_needed()
+        # The mutators and move_cursor keep the cursor inside the text
+        assert 0 <= self.cursor_y < len(self.text) and 0 <= self.cursor_x <= self.line_len(self.cursor_y)
+
+        # Update scroll position to keep cursor visible; a cursor that stayed
+        # on its row is still visible unless the editor height, which follows
+        # the line count, changed under it
+        if self.cursor_y != old_cursor_y or len(self.text) != old_line_count:
+            self.scroll_if_needed()
         return True
     
     def scroll_if_needed(self):
         # Determine visible area
-        editor_start_row = self.cat_editor.cat_head_height if hasattr(self, 'cat_editor') else 3
-        editor_height = self.cat_editor.calculate_editor_space() if hasattr(self, 'cat_editor') else 10
+        if self.cat_editor is None:
+            editor_height = 10
+        else:
+            editor_height = self.cat_editor.calculate_editor_space()
         
         # Scroll down if cursor below visible area
         if self.cursor_y - self.scroll_y >= editor_height:
@@ -187,61 +498,109 @@ class TextEditor:
         if self.cursor_y < self.scroll_y:
             self.scroll_y = self.cursor_y
 
-    def draw_status_bar(self, row):
+    def draw_status_bar(self, row, hw, full=False):
         # Draw status bar with filename, modified status, cursor position
-        height, width = self.stdscr.getmaxyx()
-        status = f" {self.filename or 'Untitled'} "
-        status += "* " if self.modified else "  "
-        status += f"| Line {self.cursor_y+1}/{len(self.text)} | Col {self.cursor_x+1} "
+        height, width = hw
+        tail = f"| Col {self.cursor_x+1} "
         
         try:
-            self.stdscr.attron(curses.A_REVERSE)
-            self.stdscr.addstr(row, 0, status.ljust(width-1))
-            self.stdscr.attroff(curses.A_REVERSE)
-            
-            # Draw message line
-            if self.status_timer > 0:
-                self.status_timer -= 1
-                self.stdscr.addstr(row+1, 0, self.status_message[:width-1].ljust(width-1))
+            # Everything before the column only changes with these; while it
+            # is unchanged just the column part is rewritten
+            prefix_key = (self.filename, self.modified, self.cursor_y, len(self.text), width)
+            if full or prefix_key != self._status_prefix_key:
+                status = f" {self.filename or 'Untitled'} "
+                status += "* " if self.modified else "  "
+                status += f"| Line {self.cursor_y+1}/{len(self.text)} "
+                self._status_prefix_key = prefix_key
+                self._status_prefix_cols = text_width(status)
+                bar = encode_row(status + tail, width-1, self.stdscr.encoding)
+                self.stdscr.addstr(row, 0, bar, STATUS_ATTR)
             else:
-                self.stdscr.addstr(row+1, 0, " " * (width-1))
+                col = self._status_prefix_cols
+                if col < width-1:
+                    self.stdscr.addnstr(row, col, tail.ljust(width-1-col), width-1-col, STATUS_ATTR)
+            
+            # Draw message line, only when it appears, changes or expires
+            message = self.visible_status()
+            if full or message != self._status_drawn:
+                self.stdscr.addnstr(row+1, 0, message[:width-1].ljust(width-1), width-1)
+                self._status_drawn = message
         except curses.error:
             pass
     
-    def draw(self, start_row, end_row):
-        height, width = self.stdscr.getmaxyx()
-        # Calculate visible range
-        editor_height = end_row - start_row
+    def draw(self, start_row, end_row, hw, full=False):
+        """Bring the text pad up to date and queue it for the next doupdate()."""
+        height, width = hw  # Screen size for this frame
+        # Calculate visible range; the last two rows belong to the status bar
+        editor_height = end_row - start_row - 2
+        # The pad holds a band of rows from one screenful above the viewport
+        # to one below, so scrolling inside it repaints nothing
+        band = 3 * editor_height
+        # The loader thread is appending; keep the old pad for this frame
+        if not self._text_lock.acquire(blocking=False):
+            # The last view may not fit the current layout; skip the copy
+            self._pad_view = None
+            self.draw_status_bar(end_row - 2, hw, full)
+            return
+        try:
+            self._paint_pad(editor_height, band, width, full)
+        finally:
+            self._text_lock.release()
+        self._pad_view = (start_row, min(start_row + editor_height, height) - 1, width - 1)
+        
+        # Draw status bar at the end of editor area
+        self.draw_status_bar(end_row - 2, hw, full)
+
+    def _paint_pad(self, editor_height, band, width, full):
+        if full or self.pad is None or self.pad.getmaxyx() != (band, width):
+            self.pad = curses.newpad(band, width)
+            self._full_redraw = True
+        if not self._pad_top <= self.scroll_y <= self._pad_top + band - editor_height:
+            self._pad_top = max(0, self.scroll_y - editor_height)
+            self._full_redraw = True
+
+        if self._full_redraw:
+            rows = range(band)
+        else:
+            in_band = self.dirty_lines.intersection(range(self._pad_top, self._pad_top + band))
+            rows = [file_row - self._pad_top for file_row in in_band]
+        self.dirty_lines.clear()
+        self._painted_bottom = self._pad_top + band
+        self._full_redraw = False
         
         # Draw text content
-        for i in range(editor_height):
-            file_row = i + self.scroll_y
-            line_num = start_row + i
-            
+        for i in rows:
+            file_row = i + self._pad_top
             if file_row >= len(self.text):
                 # Clear rest of editor area
-                if line_num < height:
-                    try:
-                        self.stdscr.addstr(line_num, 0, " " * (width-1))
-                    except curses.error:
-                        pass
-                continue
-            
-            line = self.text[file_row]
-            if line_num < height:
-                try:
-                    # Print the line
-                    self.stdscr.addstr(line_num, 0, line[:width-1])
-                    # Clear rest of line
-                    if len(line) < width-1:
-                        self.stdscr.addstr(line_num, len(line), " " * (width-1-len(line)))
-                except curses.error:
-                    pass
-        
-        # Draw status bar at the end of editor area
-        self.draw_status_bar(end_row - 2)
+                line = ""
+            else:
+                line = self.line(file_row)
+            try:
+                # Print the line, padded to clear the rest of the row
+                self.pad.addstr(i, 0, encode_row(line, width-1, self.stdscr.encoding))
+            except curses.error:
+                pass
         
-        # Position cursor
+        try:
+            self.pad.move(self.cursor_y - self._pad_top, min(self.cursor_x, width - 1))
+        except curses.error:
+            pass
+
+    def refresh_pad(self):
+        # Copy the visible part of the pad over stdscr; call after stdscr.noutrefresh()
+        if self._pad_view is None:
+            return
+        top, bottom, right = self._pad_view
+        if bottom >= top:
+            try:
+                self.pad.noutrefresh(self.scroll_y - self._pad_top, 0, top, 0, bottom, right)
+            except curses.error:
+                pass  # Rectangle off screen after a resize; the next frame repaints
+
+    def place_cursor(self, start_row):
+        # Leave the terminal cursor at the edit position for doupdate(); the
+        # pad's cursor takes over when it is inside the visible rows
         cursor_screen_y = start_row + (self.cursor_y - self.scroll_y)
         try:
             self.stdscr.move(cursor_screen_y, self.cursor_x)
@@ -259,10 +618,14 @@ class CatEditor:
         self.min_editor_lines = 5  # Minimum editor space (when file is small)
         self.cat_head_height = 3   # Cat head + paws
         self.cat_bottom_height = 4 # Cat bottom parts
+        self.save_poll_ms = 50  # Input timeout while a save or load is in flight
+        self._frame_layout = None  # (height, width, editor_end_row) of last frame, or 'small'
+        self._layout_cache = {}  # width -> precomputed cat strings, see cat_layout()
+        self._hw = stdscr.getmaxyx()  # Screen size, only changes on KEY_RESIZE
 
     def calculate_editor_space(self):
         """Calculate the ideal editor space based on file length and screen size"""
-        height, width = self.stdscr.getmaxyx()
+        height, width = self._hw
         
         # Available space for editor (excluding status bar and help line)
         max_available = height - self.cat_head_height - self.cat_bottom_height - 1
@@ -276,43 +639,50 @@ class CatEditor:
         # But never less than minimum editor lines
         return max(editor_lines, self.min_editor_lines)
 
-    def draw_cat(self):
-        height, width = self.stdscr.getmaxyx()
+    def cat_layout(self, width):
+        """Return the cat's width-dependent strings, building them once per width."""
+        lc = self._layout_cache.get(width)
+        if lc is None:
+            cat_head = [
+                "  ∧＿∧  ",
+                " ( ･ω･) ",
+            ]
+            head_width = max(len(line) for line in cat_head)
+            head_start_col = (width - head_width) // 2
 
-        # Ensure the screen is big enough
-        if height < 10 or width < 50:
-            self.stdscr.addstr(0, 0, "Terminal too small. Please resize.")
-            self.stdscr.refresh()
-            return False
+            core_paw = "∪――――∪―"
+            left_pad = (width - len(core_paw)) // 2
+            right_pad = width - len(core_paw) - left_pad
+            paw_line = "―" * left_pad + core_paw + "―" * right_pad
 
-        # ** Cat head (centered) **
-        cat_head = [
-            "  ∧＿∧  ",
-            " ( ･ω･) ",
-        ]
-        head_width = max(len(line) for line in cat_head)
-        head_start_col = (width - head_width) // 2
-
-        for i, line in enumerate(cat_head):
-            row = i
-            if row < height:
-                try:
-                    self.stdscr.addstr(row, head_start_col, line[:width - head_start_col])
-                except curses.error:
-                    pass
+            body_core = "________"
+            left_pad = (width - len(body_core)) // 2
+            right_pad = width - len(body_core) - left_pad
+            body_line = "_" * left_pad + body_core + "_" * right_pad
 
-        # ** Cat paws line (centered) **
-        core_paw = "∪――――∪―"
-        left_pad = (width - len(core_paw)) // 2
-        right_pad = width - len(core_paw) - left_pad
-        paw_line = "―" * left_pad + core_paw + "―" * right_pad
+            lc = {
+                'cat_head': [line[:width - head_start_col] for line in cat_head],
+                'head_start_col': head_start_col,
+                'paw_line': paw_line[:width-1],
+                'body_line': body_line[:width-1],
+            }
+            self._layout_cache[width] = lc
+        return lc
 
-        paw_row = len(cat_head)
-        if paw_row < height:
+    def draw_cat(self, hw):
+        height, width = hw
+
+        # Ensure the screen is big enough
+        if height < 10 or width < 50:
+            # Wipe the last cat frame once, however the size got here
+            if self._frame_layout != 'small':
+                self.stdscr.erase()
+                self._frame_layout = 'small'
             try:
-                self.stdscr.addstr(paw_row, 0, paw_line[:width-1])
+                self.stdscr.addnstr(0, 0, "Terminal too small. Please resize.", width-1)
             except curses.error:
                 pass
+            return False
 
         # Calculate dynamic editor space
         editor_lines = self.calculate_editor_space()
@@ -324,100 +694,185 @@ class CatEditor:
         # Ensure we don't go past screen bounds
         if editor_end_row >= height - self.cat_bottom_height:
             editor_end_row = height - self.cat_bottom_height
-            
-        self.editor.draw(editor_start_row, editor_end_row)
-
-        # ** Bottom part (body + feet) **
-        body_core = "________"
-        left_pad = (width - len(body_core)) // 2
-        right_pad = width - len(body_core) - left_pad
-        body_line = "_" * left_pad + body_core + "_" * right_pad
-
-        cat_bottom = [
-            body_line,
-            " |    | ",
-            " |    | ",
-            "  U  U  ",
-        ]
-        bottom_start_row = editor_end_row
-        for i, line in enumerate(cat_bottom):
-            row = bottom_start_row + i
-            if 0 <= row < height:
-                if i == 0:
-                    # Draw the body line extended to screen edges
-                    try:
-                        self.stdscr.addstr(row, 0, line[:width-1])
-                    except curses.error:
-                        pass
-                else:
-                    # Center the rest (feet)
-                    col = (width - len(line)) // 2
+
+        # The cat body moves when the editor grows or the terminal is resized;
+        # only then is the old frame wiped and everything repainted. Between
+        # full frames the cat stays untouched in the virtual screen.
+        layout = (height, width, editor_end_row)
+        full = layout != self._frame_layout
+        if full:
+            self.stdscr.erase()
+            self._frame_layout = layout
+
+            lc = self.cat_layout(width)
+
+            # ** Cat head (centered) **
+            cat_head = lc['cat_head']
+            head_start_col = lc['head_start_col']
+
+            for i, line in enumerate(cat_head):
+                row = i
+                if row < height:
                     try:
-                        self.stdscr.addstr(row, col, line[:width-col-1])
+                        self.stdscr.addnstr(row, head_start_col, line, width - head_start_col)
                     except curses.error:
                         pass
-        
+
+            # ** Cat paws line (centered) **
+            paw_line = lc['paw_line']
+
+            paw_row = len(cat_head)
+            if paw_row < height:
+                try:
+                    self.stdscr.addnstr(paw_row, 0, paw_line, width-1)
+                except curses.error:
+                    pass
+
+        self.editor.draw(editor_start_row, editor_end_row, hw, full)
+
+        if full:
+            # ** Bottom part (body + feet) **
+            cat_bottom = [
+                self.cat_layout(width)['body_line'],
+                " |    | ",
+                " |    | ",
+                "  U  U  ",
+            ]
+            bottom_start_row = editor_end_row
+            for i, line in enumerate(cat_bottom):
+                row = bottom_start_row + i
+                if 0 <= row < height:
+                    if i == 0:
+                        # Draw the body line extended to screen edges
+                        try:
+                            self.stdscr.addnstr(row, 0, line, width-1)
+                        except curses.error:
+                            pass
+                    else:
+                        # Center the rest (feet)
+                        col = (width - len(line)) // 2
+                        try:
+                            self.stdscr.addnstr(row, col, line, width-col-1)
+                        except curses.error:
+                            pass
+
         return True
 
-    def draw_help(self):
-        height, width = self.stdscr.getmaxyx()
+    def draw_help(self, hw):
+        height, width = hw
         help_row = height - 1
         help_text = " ^X: Exit | ^S: Save | arrows: Move | ^G: Help"
         
         try:
-            self.stdscr.attron(curses.A_REVERSE)
-            self.stdscr.addstr(help_row, 0, help_text[:width-1].ljust(width-1))
-            self.stdscr.attroff(curses.A_REVERSE)
+            self.stdscr.addnstr(help_row, 0, help_text.ljust(width-1), width-1, STATUS_ATTR)
         except curses.error:
             pass
 
+    def render(self):
+        # Draw cat and editor into the virtual screen
+        hw = self._hw
+        drawn = self.draw_cat(hw)
+        if drawn:
+            # Draw help bar
+            self.draw_help(hw)
+            self.editor.place_cursor(self.cat_head_height)
+
+        # Send only the cells that changed since the last frame; the text
+        # pad goes last so stdscr's blank editor area can't cover it
+        self.stdscr.noutrefresh()
+        if drawn:
+            self.editor.refresh_pad()
+        curses.doupdate()
+
+    def handle_key(self, key):
+        if key == ord('q') or key == 17:  # 'q' or Ctrl+Q to quit
+            if self.editor.modified:
+                self.editor.set_status_message("Modified buffer exists! Use Ctrl+X to exit")
+            else:
+                self.running = False
+        elif key == curses.KEY_RESIZE:
+            # Repaint everything against the new terminal size
+            self._hw = self.stdscr.getmaxyx()
+            self._frame_layout = None
+            self._layout_cache.clear()
+            # A shorter editor may no longer show the cursor row
+            self.editor.scroll_if_needed()
+        elif key == 24:  # Ctrl+X - exit process
+            if self.editor.modified:
+                self.editor.set_status_message("Save modified buffer? (Y/n)")
+                # Show the prompt and wait for the answer
+                self.render()
+                self.stdscr.nodelay(False)
+                ch = self.stdscr.getch()
+                self.stdscr.nodelay(True)
+                if ch == ord('y') or ch == ord('Y') or ch == 10:  # Y or Enter
+                    if self.editor.save_file() and self.editor.wait_for_save():
+                        self.running = False
+                elif ch == ord('n') or ch == ord('N'):
+                    self.running = False
+            else:
+                self.running = False
+        else:
+            # Pass to editor for processing
+            self.editor.process_keypress(key)
+
+    def input_timeout(self):
+        """Milliseconds to wait for a key before the screen needs updating anyway."""
+        # Wake up periodically while a save is running to report its result,
+        # or while a file is loading to show the new lines
+        if self.editor.save_pending() or self.editor.loading:
+            return self.save_poll_ms
+        # ... or when the status message is due to disappear
+        remaining = self.editor.status_deadline - time.monotonic()
+        if remaining > 0:
+            return int(remaining * 1000) + 1
+        return -1
+
+    def handle_pending_keys(self):
+        """Wait for input, then apply every queued key; True if the screen changed."""
+        # A paste or key-repeat burst then costs one render, not one per key,
+        # and keys that change nothing (e.g. Left at the start) cost none
+        self.stdscr.timeout(self.input_timeout())
+        key = self.stdscr.getch()
+        self.stdscr.nodelay(True)
+        if key == -1:
+            return False
+        signature = self.frame_signature()
+        while key != -1 and self.running:
+            self.handle_key(key)
+            key = self.stdscr.getch()
+        return bool(self.editor.dirty_lines) or self.frame_signature() != signature
+
+    def frame_signature(self):
+        # Everything outside dirty_lines and the status message that a key
+        # can change on screen
+        ed = self.editor
+        return (ed.cursor_x, ed.cursor_y, ed.scroll_y, ed.modified, len(ed.text),
+                self._hw, self._frame_layout)
+
     def run(self):
+        self.stdscr.nodelay(True)
+        needs_render = True
         while self.running:
-            # Clear screen
-            self.stdscr.clear()
-            
-            # Draw cat and editor
-            if not self.draw_cat():
-                continue
-                
-            # Draw help bar
-            self.draw_help()
-            
-            # Refresh the screen
-            self.stdscr.refresh()
-            
+            if needs_render:
+                self.render()
+
             # Handle input
             try:
-                key = self.stdscr.getch()
-                
-                if key == ord('q') or key == 17:  # 'q' or Ctrl+Q to quit
-                    if self.editor.modified:
-                        self.editor.set_status_message("Modified buffer exists! Use Ctrl+X to exit")
-                    else:
-                        self.running = False
-                elif key == 24:  # Ctrl+X - exit process
-                    if self.editor.modified:
-                        self.editor.set_status_message("Save modified buffer? (Y/n)")
-                        ch = self.stdscr.getch()
-                        if ch == ord('y') or ch == ord('Y') or ch == 10:  # Y or Enter
-                            if self.editor.save_file():
-                                self.running = False
-                        elif ch == ord('n') or ch == ord('N'):
-                            self.running = False
-                    else:
-                        self.running = False
-                else:
-                    # Pass to editor for processing
-                    self.editor.process_keypress(key)
-                    
+                needs_render = self.handle_pending_keys()
             except KeyboardInterrupt:
                 break
+            if self.editor.poll_save() or self.editor.status_changed() or self.editor.loading:
+                needs_render = True
 
 
 def main(stdscr, filename=None):
+    global STATUS_ATTR
     # Setup terminal
     curses.start_color()
     curses.use_default_colors()
+    curses.init_pair(1, -1, -1)  # Terminal's default colors
+    STATUS_ATTR = curses.A_REVERSE | curses.color_pair(1)
     curses.curs_set(1)  # Show cursor for text editing
     curses.raw()  # Get control characters
     
@@ -427,4 +882,5 @@ def main(stdscr, filename=None):
 
 
 if __name__ == "__main__":
+    curses.use_env(True)  # Honour LINES/COLUMNS; must precede initscr()
     curses.wrapper(main, sys.argv[1] if len(sys.argv) > 1 else None)
\ No newline at end of file
@@ -0,0 +1,345 @@
+import curses
+import threading
+import time
+
+import pytest
+
+import nyan
+
+
+@pytest.fixture
+def fake_curses(monkeypatch):
+    # There is no real terminal to flush to or to make pads for
+    monkeypatch.setattr(curses, 'doupdate', lambda: None)
+    monkeypatch.setattr(curses, 'newpad', FakeScreen)
+
+
+class FakeScreen:
+    """Stand-in for a curses window that records the calls made on it."""
+
+    encoding = 'utf-8'
+
+    def __init__(self, height=30, width=80, keys=()):
+        self.height = height
+        self.width = width
+        self.keys = list(keys)
+        self.calls = []
+
+    def getmaxyx(self):
+        return self.height, self.width
+
+    def getch(self):
+        if not self.keys:
+            return -1
+        key = self.keys.pop(0)
+        return key() if callable(key) else key
+
+    def resize_key(self, height, width):
+        """Return a queued key that resizes the screen as it is read."""
+        def key():
+            self.height, self.width = height, width
+            return curses.KEY_RESIZE
+        return key
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self.calls.append((name,) + args)
+        return record
+
+
+def make_editor(tmp_path, content=None, height=30, width=80):
+    path = tmp_path / "file.txt"
+    if content is not None:
+        path.write_text(content, encoding='utf-8')
+    cat = nyan.CatEditor(FakeScreen(height, width), str(path))
+    return cat.editor
+
+
+def buffer_text(editor):
+    return [editor.line(y) for y in range(len(editor.text))]
+
+
+def type_keys(editor, keys):
+    for key in keys:
+        editor.process_keypress(ord(key) if isinstance(key, str) else key)
+
+
+def test_typing_enter_and_backspace(tmp_path):
+    editor = make_editor(tmp_path, "hello\nworld\n")
+    type_keys(editor, [curses.KEY_END, "!", 10, "x", "y"])
+    assert buffer_text(editor) == ["hello!", "xy", "world"]
+    assert (editor.cursor_y, editor.cursor_x) == (1, 2)
+
+    type_keys(editor, [127, 127, 127])
+    assert buffer_text(editor) == ["hello!", "world"]
+    assert (editor.cursor_y, editor.cursor_x) == (0, 6)
+    assert editor.modified
+
+
+def test_typing_marks_only_the_cursor_row(tmp_path):
+    editor = make_editor(tmp_path, "one\ntwo\nthree\n")
+    type_keys(editor, [curses.KEY_DOWN, "x"])
+    assert editor.dirty_lines == {1}
+
+
+def test_line_shifts_only_mark_painted_rows(tmp_path):
+    editor = make_editor(tmp_path, "x\n" * 20000)
+    editor._painted_bottom = 60
+    type_keys(editor, [10, 127])
+    assert editor.dirty_lines <= set(range(60))
+    assert len(editor.text) == 20000
+
+
+def test_resize_keeps_cursor_visible(tmp_path, fake_curses):
+    editor = make_editor(tmp_path, "".join(f"{i}\n" for i in range(100)), height=60)
+    cat = editor.cat_editor
+    cat.stdscr.keys = [curses.KEY_DOWN] * 40 + [cat.stdscr.resize_key(20, 80), ord('q')]
+    cat.run()
+    assert editor.scroll_y <= editor.cursor_y < editor.scroll_y + cat.calculate_editor_space()
+
+
+def test_shrinking_below_minimum_erases_the_cat(tmp_path, fake_curses):
+    editor = make_editor(tmp_path, "one\n", height=24, width=80)
+    screen = editor.cat_editor.stdscr
+    # -1 ends the first burst of keys, so a frame is drawn at the small size
+    screen.keys = [screen.resize_key(8, 40), -1, ord('q')]
+    editor.cat_editor.run()
+    first_frame = screen.calls.index(('noutrefresh',))
+    too_small = screen.calls.index(('addnstr', 0, 0, "Terminal too small. Please resize.", 39))
+    assert ('erase',) in screen.calls[first_frame:too_small]
+
+
+def test_joining_lines_with_non_ascii_text(tmp_path):
+    editor = make_editor(tmp_path, "héllo\nab\n")
+    type_keys(editor, [curses.KEY_DOWN, curses.KEY_HOME, 127, "z", 10])
+    assert buffer_text(editor) == ["hélloz", "ab"]
+    assert (editor.cursor_y, editor.cursor_x) == (1, 0)
+
+
+@pytest.mark.parametrize("text", ["", "abc", "héllo ∧＿∧"])
+def test_gap_line_edits(text):
+    line = nyan.GapLine(text, len(text) // 2)
+    expected = list(text)
+    for x, ch in [(0, "a"), (len(expected), "漢"), (1, "b")]:
+        line.move_gap(x)
+        line.insert(ord(ch))
+        expected.insert(x, ch)
+        assert str(line) == "".join(expected)
+        assert len(line) == len(expected)
+    line.backspace()
+    del expected[1]
+    assert str(line) == "".join(expected)
+    assert line.take_left() == expected[0]
+    assert str(line) == "".join(expected[1:])
+
+
+def test_ascii_gap_line_stays_in_bytes():
+    line = nyan.GapLine("abc", 1)
+    line.insert(ord("x"))
+    line.move_gap(4)
+    assert isinstance(line.left, bytearray)
+    assert str(line) == "axbc"
+
+
+def test_pending_keys_are_drained_before_a_frame(tmp_path):
+    editor = make_editor(tmp_path, "\n")
+    cat = editor.cat_editor
+    cat.stdscr.keys = [ord(c) for c in "abc"]
+    assert cat.handle_pending_keys()
+    assert buffer_text(editor) == ["abc"]
+    assert not cat.stdscr.keys
+    assert not cat.handle_pending_keys()
+
+
+@pytest.mark.parametrize("line, row", [
+    ("abcdef", "abcd"),
+    ("漢字漢字", "漢字"),
+    ("a漢字", "a漢 "),
+    ("e\u0301tude", "e\u0301tud"),
+    ("\tx", "    "),
+])
+def test_encode_row_fits_screen_cells(line, row):
+    assert nyan.encode_row(line, 4, 'utf-8') == row.encode('utf-8')
+
+
+def test_load_keeps_control_characters_inside_lines(tmp_path):
+    editor = make_editor(tmp_path, "tab\there\fform feed\r\nlast\n")
+    assert buffer_text(editor) == ["tab\there\fform feed", "last"]
+
+
+def test_save_round_trips_control_characters(tmp_path):
+    content = "tab\there\fform feed\nlast\n"
+    editor = make_editor(tmp_path, content)
+    type_keys(editor, ["!"])
+    assert editor.save_file() and editor.wait_for_save()
+    assert not editor.modified
+    assert (tmp_path / "file.txt").read_text(encoding='utf-8') == "!" + content
+
+
+def test_edit_during_save_keeps_modified(tmp_path):
+    editor = make_editor(tmp_path, "one\n")
+    type_keys(editor, ["a"])
+    assert editor.save_file()
+    type_keys(editor, ["b"])
+    assert editor.wait_for_save()
+    assert editor.modified
+    assert (tmp_path / "file.txt").read_text(encoding='utf-8') == "aone\n"
+
+
+def test_status_message_expires_on_its_deadline(tmp_path, monkeypatch):
+    editor = make_editor(tmp_path)
+    now = [100.0]
+    monkeypatch.setattr(nyan.time, 'monotonic', lambda: now[0])
+    editor.set_status_message("hello", ttl=2)
+    assert editor.cat_editor.input_timeout() == 2001
+    editor.draw_status_bar(20, (30, 80))
+    assert editor.visible_status() == "hello"
+    assert not editor.status_changed()
+
+    now[0] += 2
+    assert editor.visible_status() == ""
+    assert editor.status_changed()
+    assert editor.cat_editor.input_timeout() == -1
+
+
+def test_line_start_index_follows_edits(tmp_path):
+    editor = make_editor(tmp_path, "ab\ncde\n\nf\n")
+
+    def expected_starts():
+        starts = [0]
+        for line in buffer_text(editor)[:-1]:
+            starts.append(starts[-1] + len(line) + 1)
+        return starts
+
+    assert [editor.line_start(y) for y in range(4)] == expected_starts()
+    assert editor.position_of(5) == (1, 2)
+    for keys in ([curses.KEY_DOWN, "x"], [10], [127, 127], [curses.KEY_END, 10, "y"]):
+        type_keys(editor, keys)
+        starts = expected_starts()
+        assert [editor.line_start(y) for y in range(len(starts))] == starts
+        y, x = editor.cursor_y, editor.cursor_x
+        assert editor.position_of(editor.offset_of(y, x)) == (y, x)
+
+
+def test_cursor_moves_stay_in_bounds(tmp_path):
+    editor = make_editor(tmp_path, "a long line\nab\n")
+    type_keys(editor, [curses.KEY_END, curses.KEY_DOWN])
+    assert (editor.cursor_y, editor.cursor_x) == (1, 2)
+    type_keys(editor, [curses.KEY_RIGHT, curses.KEY_RIGHT, curses.KEY_DOWN])
+    assert (editor.cursor_y, editor.cursor_x) == (1, 2)
+    type_keys(editor, [curses.KEY_HOME, curses.KEY_LEFT])
+    assert (editor.cursor_y, editor.cursor_x) == (0, 11)
+    type_keys(editor, [curses.KEY_UP, curses.KEY_HOME, curses.KEY_LEFT, 127])
+    assert (editor.cursor_y, editor.cursor_x) == (0, 0)
+    assert buffer_text(editor) == ["a long line", "ab"]
+
+
+def test_status_column_is_spliced_after_a_wide_filename(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = "漢字.txt"
+    (tmp_path / path).write_text("hello\n", encoding='utf-8')
+    cat = nyan.CatEditor(FakeScreen(30, 80), path)
+    editor = cat.editor
+    editor.draw_status_bar(20, (30, 80))
+    type_keys(editor, [curses.KEY_END])
+    cat.stdscr.calls.clear()
+    editor.draw_status_bar(20, (30, 80))
+
+    # Only the column part is rewritten, after the prefix's screen cells;
+    # the two wide characters take two cells each
+    prefix = f" {path}   | Line 1/1 "
+    [(name, row, col, text, n, attr)] = cat.stdscr.calls
+    assert (name, row, col) == ('addnstr', 20, len(prefix) + 2)
+    assert text.startswith("| Col 6 ")
+
+
+def test_scrolling_inside_the_pad_band_repaints_nothing(tmp_path, fake_curses):
+    editor = make_editor(tmp_path, "".join(f"{i}\n" for i in range(200)))
+    editor.draw(3, 25, (30, 80))
+    pad = editor.pad
+    type_keys(editor, [curses.KEY_DOWN] * 25)
+    assert editor.scroll_y > 0
+    pad.calls.clear()
+    editor.draw(3, 25, (30, 80))
+    assert editor.pad is pad
+    assert not [call for call in pad.calls if call[0] == 'addstr']
+
+
+def test_keys_that_change_nothing_skip_the_render(tmp_path):
+    editor = make_editor(tmp_path, "abc\n")
+    cat = editor.cat_editor
+    cat.stdscr.keys = [curses.KEY_LEFT, curses.KEY_UP, curses.KEY_HOME]
+    assert not cat.handle_pending_keys()
+    cat.stdscr.keys = [curses.KEY_RIGHT]
+    assert cat.handle_pending_keys()
+
+
+def test_scroll_is_rechecked_only_when_rows_change(tmp_path, monkeypatch):
+    editor = make_editor(tmp_path, "abc\ndef\n")
+    checks = []
+    monkeypatch.setattr(editor, 'scroll_if_needed', lambda: checks.append(editor.cursor_y))
+    type_keys(editor, [curses.KEY_RIGHT, "x", curses.KEY_END])
+    assert checks == []
+    type_keys(editor, [curses.KEY_DOWN, 10])
+    assert checks == [1, 2]
+
+
+def wait_for_load(editor):
+    deadline = time.monotonic() + 5
+    while editor.loading and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not editor.loading
+
+
+def test_large_file_loads_in_background(tmp_path, monkeypatch):
+    # Hold the loader thread back until the test has checked the first chunk
+    release = threading.Event()
+    load_rest = nyan.TextEditor._load_rest
+
+    def gated_load_rest(self, file):
+        release.wait(5)
+        load_rest(self, file)
+
+    monkeypatch.setattr(nyan.TextEditor, "LOAD_CHUNK", 64)
+    monkeypatch.setattr(nyan.TextEditor, "_load_rest", gated_load_rest)
+    lines = [f"line {i}" for i in range(500)]
+    editor = make_editor(tmp_path, "\n".join(lines) + "\n")
+    assert editor.loading
+    assert buffer_text(editor) == lines[:len(editor.text)]
+    assert not editor.save_file()
+
+    release.set()
+    wait_for_load(editor)
+    assert buffer_text(editor) == lines
+    assert editor.save_file() and editor.wait_for_save()
+
+
+def test_failed_load_refuses_to_save(tmp_path, monkeypatch):
+    read_lines = nyan.TextEditor._read_lines
+    calls = []
+
+    def failing_read_lines(self, file):
+        calls.append(file)
+        if len(calls) > 1:
+            raise OSError("disk went away")
+        return read_lines(self, file)
+
+    monkeypatch.setattr(nyan.TextEditor, "LOAD_CHUNK", 64)
+    monkeypatch.setattr(nyan.TextEditor, "_read_lines", failing_read_lines)
+    content = "".join(f"line {i}\n" for i in range(500))
+    editor = make_editor(tmp_path, content)
+    wait_for_load(editor)
+    assert editor.visible_status() == "Error reading: disk went away"
+    assert not editor.save_file()
+    assert (tmp_path / "file.txt").read_text(encoding='utf-8') == content
+
+
+def test_skipped_frame_does_not_copy_stale_pad(tmp_path):
+    editor = make_editor(tmp_path, "one\ntwo\n")
+    editor.pad = FakeScreen()
+    editor._pad_view = (5, 40, 79)
+    with editor._text_lock:
+        editor.draw(5, 12, (20, 80))
+    editor.refresh_pad()
+    assert editor._pad_view is None
+    assert editor.pad.calls == []